@@ -28,6 +28,11 @@ import re
 import sys
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 scripts_dir = os.path.dirname(os.path.abspath(__file__))
 api_dir = os.path.join(os.path.dirname(scripts_dir), "data", "api")
@@ -41,7 +46,7 @@ def resolve_references(path, schema):
             path = os.path.join(os.path.dirname(path), value)
             try:
                 with open(path, encoding="utf-8") as f:
-                    ref = yaml.safe_load(f)
+                    ref = yaml.load(f, Loader=SafeLoader)
                 result = resolve_references(path, ref)
                 del schema['$ref']
                 path = previous_path
@@ -164,7 +169,7 @@ output = {
 selected_api_dir = os.path.join(api_dir, selected_api)
 try:
     with open(os.path.join(selected_api_dir, 'definitions', 'security.yaml')) as f:
-        output['securityDefinitions'] = yaml.safe_load(f)
+        output['securityDefinitions'] = yaml.load(f, Loader=SafeLoader)
 except FileNotFoundError:
     print("No security definitions available for this API")
 
@@ -176,7 +181,7 @@ for filename in os.listdir(selected_api_dir):
 
     print("Reading swagger API: %s" % filepath)
     with open(filepath, "r") as f:
-        api = yaml.safe_load(f.read())
+        api = yaml.load(f, Loader=SafeLoader)
         api = resolve_references(filepath, api)
 
         basePath = api['basePath']